@@ -1,6 +1,13 @@
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from fastsqs import FastSQS, SQSEvent, QueueType
+from fastsqs.utils import json_dumps
 from fastsqs.middleware import (
-    IdempotencyMiddleware, MemoryIdempotencyStore, 
+    IdempotencyMiddleware, BloomIdempotencyStore,
     ErrorHandlingMiddleware, RetryConfig,
     VisibilityTimeoutMonitor, ProcessingTimeMiddleware,
     ParallelizationMiddleware, ParallelizationConfig, ConcurrencyLimiter
@@ -45,8 +52,8 @@ app = FastSQS(
     enable_partial_batch_failure=True
 )
 
-# Configure idempotency with memory store
-idempotency_store = MemoryIdempotencyStore()
+# Configure idempotency with bounded Bloom-filtered store
+idempotency_store = BloomIdempotencyStore()
 app.add_middleware(IdempotencyMiddleware(
     store=idempotency_store,
     ttl_seconds=3600,  # 1 hour
@@ -80,8 +87,8 @@ app.add_middleware(ProcessingTimeMiddleware(
 # Configure parallelization with resource pooling
 parallelization_config = ParallelizationConfig(
     max_concurrent_messages=5,
-    use_thread_pool=True,
-    thread_pool_size=4
+    use_asyncio=True,
+    use_thread_pool=False
 )
 
 # Note: In a real application, you might use actual database connections
@@ -222,23 +229,26 @@ def test_advanced_features():
     
     # Test case 4: Parallel processing
     print("--- Test 4: Parallel Processing ---")
-    event4 = {
-        "Records": [
-            {
-                "messageId": f"msg-{i:03d}",
-                "body": json.dumps({
-                    "type": "order_processed",
-                    "order_id": f"ORD-{i:03d}",
-                    "customer_id": f"CUST-{i:03d}",
-                    "amount": 10.00 + i,
-                    "timestamp": "2024-01-01T10:00:00Z"
-                }),
-                "attributes": {}
-            }
-            for i in range(1, 6)  # 5 messages for parallel processing
-        ]
+    # Build the synthetic batch from a shared template outside the record
+    # dicts, serializing with json_dumps (orjson when installed) so setup
+    # cost stays out of the timed dispatch below.
+    order_template = {
+        "type": "order_processed",
+        "timestamp": "2024-01-01T10:00:00Z",
     }
-    
+
+    def order_records(count):
+        for i in range(1, count + 1):
+            body = json_dumps({
+                **order_template,
+                "order_id": f"ORD-{i:03d}",
+                "customer_id": f"CUST-{i:03d}",
+                "amount": 10.00 + i,
+            })
+            yield {"messageId": f"msg-{i:03d}", "body": body, "attributes": {}}
+
+    event4 = {"Records": list(order_records(5))}  # 5 messages for parallel processing
+
     start_time = time.time()
     result4 = lambda_handler(event4, None)
     end_time = time.time()
@@ -1,9 +1,16 @@
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 import json
 import asyncio
 from typing import Dict, Any, List
 from fastsqs import FastSQS, SQSEvent
+from fastsqs.utils import json_dumps
 from fastsqs.middleware import (
-    IdempotencyMiddleware, MemoryIdempotencyStore,
+    IdempotencyMiddleware, BloomIdempotencyStore,
     ErrorHandlingMiddleware, RetryConfig, DeadLetterQueueMiddleware,
     VisibilityTimeoutMonitor, ProcessingTimeMiddleware,
     ParallelizationMiddleware, ParallelizationConfig,
@@ -27,8 +34,8 @@ class CriticalMessage(SQSEvent):
 app = FastSQS()
 
 # Configure comprehensive middleware stack
-idempotency_store = MemoryIdempotencyStore()
-idempotency_middleware = IdempotencyMiddleware(idempotency_store)
+idempotency_store = BloomIdempotencyStore(max_entries=10_000)
+idempotency_middleware = IdempotencyMiddleware(idempotency_store, ttl_seconds=3600)
 
 retry_config = RetryConfig(
     max_retries=3,
@@ -48,8 +55,8 @@ processing_middleware = ProcessingTimeMiddleware()
 
 parallelization_config = ParallelizationConfig(
     max_concurrent_messages=5,
-    use_thread_pool=True,
-    thread_pool_size=3,
+    use_asyncio=True,
+    use_thread_pool=False,
     batch_processing=True,
     batch_size=10,
     batch_timeout=5.0
@@ -110,36 +117,26 @@ async def handle_critical_messages(msg: CriticalMessage) -> Dict[str, Any]:
     }
 
 def lambda_handler(event, context):
-    """AWS Lambda handler with comprehensive middleware"""
-    try:
-        # Process the SQS event
-        result = app.handler(event, context)
-        
-        # Get middleware statistics
+    """AWS Lambda handler with comprehensive middleware.
+
+    Returns the partial batch failure response untouched: the SQS event
+    source mapping deletes every record not listed in batchItemFailures
+    in bulk and redelivers only the failed ones. Wrapping the result in
+    an HTTP-style statusCode/body envelope (or raising) would make
+    Lambda retry or drop the whole batch instead.
+    """
+    result = app.handler(event, context)
+
+    if app.debug:
         stats = {
             "idempotency_stats": len(idempotency_store._store),
             "processing_stats": processing_middleware.get_stats() if hasattr(processing_middleware, 'get_stats') else {},
-            "parallelization_stats": parallel_middleware.get_stats() if hasattr(parallel_middleware, 'get_stats') else {}
-        }
-        
-        print(f"Processing completed. Stats: {json.dumps(stats, indent=2)}")
-        
-        return {
-            "statusCode": 200,
-            "body": json.dumps({
-                "message": "Successfully processed messages",
-                "stats": stats
-            })
-        }
-        
-    except Exception as e:
-        print(f"Error processing event: {str(e)}")
-        return {
-            "statusCode": 500,
-            "body": json.dumps({
-                "error": str(e)
-            })
+            "parallelization_stats": parallel_middleware.get_stats() if hasattr(parallel_middleware, 'get_stats') else {},
+            "batch_item_failures": len(result.get("batchItemFailures", [])),
         }
+        print(f"Processing completed. Stats: {json_dumps(stats)}")
+
+    return result
 
 # Example usage for local testing
 if __name__ == "__main__":
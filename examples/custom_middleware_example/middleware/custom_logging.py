@@ -1,11 +1,20 @@
 from fastsqs import Middleware
+import sys
 import time
 
 class CustomLoggingMiddleware(Middleware):
+    """Buffers log lines per message and flushes them with one stdout write.
+
+    Each print() takes the interpreter's stdout lock and issues its own
+    write syscall; batching the lines keeps concurrent records from
+    interleaving and cuts the per-message I/O to a single call.
+    """
+
     async def before(self, payload, record, context, ctx):
-        print(f"[BEFORE] Processing message {record.get('messageId')}")
-        print(f"[BEFORE] Action: {payload.get('action')}")
-        print(f"[BEFORE] Timestamp: {time.time()}")
+        lines = ctx.setdefault("log_buffer", [])
+        lines.append(f"[BEFORE] Processing message {record.get('messageId')}")
+        lines.append(f"[BEFORE] Action: {payload.get('action')}")
+        lines.append(f"[BEFORE] Timestamp: {time.time()}")
         ctx["start_time"] = time.time()
         ctx["message_count"] = ctx.get("message_count", 0) + 1
 
@@ -13,8 +22,11 @@ class CustomLoggingMiddleware(Middleware):
         end_time = time.time()
         start_time = ctx.get("start_time", end_time)
         duration = end_time - start_time
-        print(f"[AFTER] Message {record.get('messageId')} processed")
-        print(f"[AFTER] Duration: {duration:.3f}s")
-        print(f"[AFTER] Result: {result}")
+        lines = ctx.setdefault("log_buffer", [])
+        lines.append(f"[AFTER] Message {record.get('messageId')} processed")
+        lines.append(f"[AFTER] Duration: {duration:.3f}s")
+        lines.append(f"[AFTER] Result: {result}")
         message_count = ctx.get("message_count", 0)
-        print(f"[AFTER] Total messages processed: {message_count}")
+        lines.append(f"[AFTER] Total messages processed: {message_count}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        ctx["log_buffer"] = []
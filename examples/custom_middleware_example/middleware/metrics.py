@@ -1,14 +1,47 @@
 from fastsqs import Middleware
+import json
 import time
+from collections import deque
 
 class MetricsMiddleware(Middleware):
+    def __init__(self, window_size: int = 256, emit_emf: bool = False,
+                 namespace: str = "FastSQS"):
+        super().__init__()
+        self.window_size = window_size
+        self.emit_emf = emit_emf
+        self.namespace = namespace
+
+    def _emit_emf(self, duration, success):
+        # CloudWatch Embedded Metric Format: one structured log line and
+        # CloudWatch does the aggregation, instead of computing stats here
+        blob = {
+            "_aws": {
+                "Timestamp": int(time.time() * 1000),
+                "CloudWatchMetrics": [{
+                    "Namespace": self.namespace,
+                    "Dimensions": [["Status"]],
+                    "Metrics": [
+                        {"Name": "ProcessingTime", "Unit": "Seconds"},
+                        {"Name": "Messages", "Unit": "Count"},
+                    ],
+                }],
+            },
+            "Status": "Success" if success else "Failure",
+            "ProcessingTime": duration,
+            "Messages": 1,
+        }
+        print(json.dumps(blob))
+
     async def before(self, payload, record, context, ctx):
         if "metrics" not in ctx:
             ctx["metrics"] = {
                 "total_messages": 0,
                 "successful_messages": 0,
                 "failed_messages": 0,
-                "processing_times": [],
+                "total_processing_time": 0.0,
+                # Bounded ring buffer of recent samples instead of an
+                # unbounded list; aggregate stats run off the counters
+                "recent_processing_times": deque(maxlen=self.window_size),
             }
         ctx["metrics"]["total_messages"] += 1
         ctx["start_time"] = time.time()
@@ -18,10 +51,17 @@ class MetricsMiddleware(Middleware):
         start_time = ctx.get("start_time", end_time)
         duration = end_time - start_time
         ctx["metrics"]["successful_messages"] += 1
-        ctx["metrics"]["processing_times"].append(duration)
+        ctx["metrics"]["total_processing_time"] += duration
+        ctx["metrics"]["recent_processing_times"].append(duration)
+        if self.emit_emf:
+            self._emit_emf(duration, success=True)
 
     async def error(self, payload, record, context, ctx, error):
         ctx["metrics"]["failed_messages"] += 1
+        duration = time.time() - ctx.get("start_time", time.time())
+        if self.emit_emf:
+            self._emit_emf(duration, success=False)
+            return
         metrics = ctx.get("metrics", {})
         print("\n=== METRICS SUMMARY ===")
         print(f"Total messages: {metrics['total_messages']}")
@@ -29,6 +69,6 @@ class MetricsMiddleware(Middleware):
         print(f"Failed: {metrics['failed_messages']}")
         success_rate = metrics["successful_messages"] / metrics["total_messages"] * 100
         print(f"Success rate: {success_rate:.1f}%")
-        if metrics["processing_times"]:
-            avg_time = sum(metrics["processing_times"]) / len(metrics["processing_times"])
+        if metrics["successful_messages"]:
+            avg_time = metrics["total_processing_time"] / metrics["successful_messages"]
             print(f"Average processing time: {avg_time:.3f}s")
@@ -1,5 +1,11 @@
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from fastsqs import FastSQS, SQSEvent, LoggingMiddleware, TimingMsMiddleware
-import json
+from fastsqs.utils import json_dumps
 import asyncio
 
 
@@ -30,6 +36,14 @@ class ProfileUpdate(SQSEvent):
         return "profile_update"
 
 
+import logging
+
+# Handler output goes through the logging framework; Lambda's root handler
+# is configured once per container, so records aren't serialized behind
+# per-line print flushes
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
 app = FastSQS(
     title="Middleware Example App",
     description="Example showing built-in middleware usage",
@@ -44,21 +58,21 @@ app.add_middleware(TimingMsMiddleware())
 
 @app.route(UserLogin)
 async def handle_user_login(msg: UserLogin):
-    print(f"User logged in: {msg.user_id}")
+    log.info("User logged in: %s", msg.user_id)
     await asyncio.sleep(0.1)
     return {"status": "success", "userId": msg.user_id}
 
 
 @app.route(UserLogout)
 async def handle_user_logout(msg: UserLogout):
-    print(f"User logged out: {msg.user_id}")
+    log.info("User logged out: %s", msg.user_id)
     await asyncio.sleep(0.05)
     return {"status": "success", "userId": msg.user_id}
 
 
 @app.route(ProfileUpdate)
 async def handle_profile_update(msg: ProfileUpdate):
-    print(f"Profile updated for user: {msg.user_id}")
+    log.info("Profile updated for user: %s", msg.user_id)
     await asyncio.sleep(0.2)
     return {"status": "success", "userId": msg.user_id}
 
@@ -69,61 +83,42 @@ def lambda_handler(event, context):
 def test_middleware():
     print("=== Testing Middleware ===")
 
-    test_events = [
+    test_payloads = [
         {
-            "Records": [
-                {
-                    "messageId": "msg-001",
-                    "body": json.dumps(
-                        {
-                            "action": "login",
-                            "user_id": "user123",
-                            "password": "secret123",
-                            "timestamp": "2024-01-01T10:00:00Z",
-                        }
-                    ),
-                    "attributes": {},
-                }
-            ]
+            "action": "login",
+            "user_id": "user123",
+            "password": "secret123",
+            "timestamp": "2024-01-01T10:00:00Z",
         },
         {
-            "Records": [
-                {
-                    "messageId": "msg-002",
-                    "body": json.dumps(
-                        {
-                            "action": "profile_update",
-                            "user_id": "user123",
-                            "ssn": "123-45-6789",
-                            "email": "user@example.com",
-                        }
-                    ),
-                    "attributes": {},
-                }
-            ]
+            "action": "profile_update",
+            "user_id": "user123",
+            "ssn": "123-45-6789",
+            "email": "user@example.com",
         },
         {
-            "Records": [
-                {
-                    "messageId": "msg-003",
-                    "body": json.dumps(
-                        {
-                            "action": "logout",
-                            "user_id": "user123",
-                            "session_id": "sess-456",
-                        }
-                    ),
-                    "attributes": {},
-                }
-            ]
+            "action": "logout",
+            "user_id": "user123",
+            "session_id": "sess-456",
         },
     ]
 
-    for i, event in enumerate(test_events, 1):
+    # Serialize the whole batch up front so per-event setup stays out of
+    # the dispatch being exercised
+    bodies = [json_dumps(payload) for payload in test_payloads]
+
+    for i, body in enumerate(bodies, 1):
         print(f"\n--- Test Event {i} ---")
+        event = {
+            "Records": [
+                {"messageId": f"msg-{i:03d}", "body": body, "attributes": {}}
+            ]
+        }
         result = lambda_handler(event, None)
         print(f"Result: {result}")
 
 
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     test_middleware()
\ No newline at end of file
@@ -1,6 +1,20 @@
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from fastsqs import FastSQS, SQSRouter, SQSEvent, LoggingMiddleware, TimingMsMiddleware
-import json
+from fastsqs.utils import json_dumps
+
+
+import logging
 
+# Handler output goes through the logging framework; Lambda's root handler
+# is configured once per container, so records aren't serialized behind
+# per-line print flushes
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
 
 class CreateUser(SQSEvent):
     name: str
@@ -61,52 +75,57 @@ app.include_router(router)
 
 @create_router.route("user")
 async def handle_create_user(msg: CreateUser):
-    print(f"[CREATE USER] name={msg.name} email={msg.email}")
+    log.info("[CREATE USER] name=%s email=%s", msg.name, msg.email)
     return {"status": "success", "action": "create_user", "name": msg.name}
 
 
 @create_router.route("order")
 async def handle_create_order(msg: CreateOrder):
-    print(f"[CREATE ORDER] order_id={msg.order_id}")
+    log.info("[CREATE ORDER] order_id=%s", msg.order_id)
     return {"status": "success", "action": "create_order", "order_id": msg.order_id}
 
 
 @router.route("update")
 async def handle_update_user(msg: UpdateUser):
-    print(f"[UPDATE USER] user_id={msg.user_id} name={msg.name}")
+    log.info("[UPDATE USER] user_id=%s name=%s", msg.user_id, msg.name)
     return {"status": "success", "action": "update", "user_id": msg.user_id}
 
 
 @router.route("delete")
 async def handle_delete_user(msg: DeleteUser):
-    print(f"[DELETE USER] user_id={msg.user_id}")
+    log.info("[DELETE USER] user_id=%s", msg.user_id)
     return {"status": "success", "action": "delete", "user_id": msg.user_id}
 
 
 @router.route("search")
 async def handle_search_users(msg: SearchUsers):
-    print(f"[SEARCH USERS] query={msg.query}")
+    log.info("[SEARCH USERS] query=%s", msg.query)
     return {"status": "success", "action": "search", "query": msg.query}
 
 
 @db_router.route("rds")
 async def handle_write_to_rds(msg: WriteToRds):
-    print(f"[WRITE TO RDS] table={msg.table} data={msg.data}")
+    log.info("[WRITE TO RDS] table=%s data=%s", msg.table, msg.data)
     return {"status": "success", "action": "write_rds", "table": msg.table}
 
 
 @db_router.route("cache")
 async def handle_write_to_cache(msg: WriteToCache):
-    print(f"[WRITE TO CACHE] key={msg.key} value={msg.value}")
+    log.info("[WRITE TO CACHE] key=%s value=%s", msg.key, msg.value)
     return {"status": "success", "action": "write_cache", "key": msg.key}
 
 
 @router.wildcard()
 async def handle_unknown_action(msg: UnknownAction):
-    print(f"[FALLBACK] Unknown action with data={msg.data}")
+    log.info("[FALLBACK] Unknown action with data=%s", msg.data)
     return {"status": "error", "message": "Unknown action"}
 
 
+# All routes are registered above; build the dispatch tables at import
+# time so the first record pays a plain dict lookup
+app.freeze()
+
+
 def lambda_handler(event, context):
     return app.handler(event, context)
 
@@ -125,13 +144,16 @@ def test_nested_routing():
         {"action": "unknown", "data": "test"},
     ]
 
-    for i, test_case in enumerate(test_cases, 1):
+    # Serialize every case once, outside the dispatch loop
+    bodies = [json_dumps(test_case) for test_case in test_cases]
+
+    for i, (test_case, body) in enumerate(zip(test_cases, bodies), 1):
         print(f"\n--- Test Case {i}: {test_case['action']} ---")
         event = {
             "Records": [
                 {
                     "messageId": f"msg-{i}",
-                    "body": json.dumps(test_case),
+                    "body": body,
                     "attributes": {},
                 }
             ]
@@ -142,4 +164,5 @@ def test_nested_routing():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     test_nested_routing()
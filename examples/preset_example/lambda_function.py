@@ -1,4 +1,4 @@
-import json
+from fastsqs.utils import json_dumps
 from typing import Dict, Any
 from fastsqs import FastSQS, SQSEvent
 
@@ -40,7 +40,7 @@ if __name__ == "__main__":
         "Records": [
             {
                 "messageId": "test-1",
-                "body": json.dumps({
+                "body": json_dumps({
                     "type": "order_processing",
                     "order_id": "order-123",
                     "customer_id": "cust-456",
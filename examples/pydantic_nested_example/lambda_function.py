@@ -1,6 +1,20 @@
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from fastsqs import FastSQS, SQSRouter, SQSEvent, LoggingMiddleware, TimingMsMiddleware
-import json
+from fastsqs.utils import json_dumps
+
+
+import logging
 
+# Handler output goes through the logging framework; Lambda's root handler
+# is configured once per container, so records aren't serialized behind
+# per-line print flushes
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
 
 # Base Events for different domains
 class UserEvent(SQSEvent):
@@ -102,45 +116,49 @@ app.include_router(system_router)
 # User Management Handlers (in user_router)
 @user_router.route(CreateUser)
 async def handle_create_user(msg: CreateUser):
-    print(f"[USER ROUTER] Creating user: {msg.name} ({msg.email}) in {msg.department}")
+    log.info("[USER ROUTER] Creating user: %s (%s) in %s", msg.name, msg.email, msg.department)
     return {"status": "success", "action": "create_user", "name": msg.name}
 
 
 @user_router.route(UpdateUser)
 async def handle_update_user(msg: UpdateUser):
-    print(
-        f"[USER ROUTER] Updating user {msg.user_id}: name={msg.name}, email={msg.email}"
+    log.info(
+        "[USER ROUTER] Updating user %s: name=%s, email=%s",
+        msg.user_id, msg.name, msg.email,
     )
     return {"status": "success", "action": "update_user", "user_id": msg.user_id}
 
 
 @user_router.route(DeleteUser)
 async def handle_delete_user(msg: DeleteUser):
-    print(f"[USER ROUTER] Deleting user {msg.user_id}, reason: {msg.reason}")
+    log.info("[USER ROUTER] Deleting user %s, reason: %s", msg.user_id, msg.reason)
     return {"status": "success", "action": "delete_user", "user_id": msg.user_id}
 
 
 # Order Management Handlers (in order_router)
 @order_router.route(CreateOrder)
 async def handle_create_order(msg: CreateOrder):
-    print(
-        f"[ORDER ROUTER] Creating order {msg.order_id} for customer {msg.customer_id}: ${msg.amount}"
+    log.info(
+        "[ORDER ROUTER] Creating order %s for customer %s: $%s",
+        msg.order_id, msg.customer_id, msg.amount,
     )
     return {"status": "success", "action": "create_order", "order_id": msg.order_id}
 
 
 @order_router.route(UpdateOrder)
 async def handle_update_order(msg: UpdateOrder):
-    print(
-        f"[ORDER ROUTER] Updating order {msg.order_id}: status={msg.status}, tracking={msg.tracking_number}"
+    log.info(
+        "[ORDER ROUTER] Updating order %s: status=%s, tracking=%s",
+        msg.order_id, msg.status, msg.tracking_number,
     )
     return {"status": "success", "action": "update_order", "order_id": msg.order_id}
 
 
 @order_router.route(ProcessPayment)
 async def handle_process_payment(msg: ProcessPayment):
-    print(
-        f"[ORDER ROUTER] Processing payment for order {msg.order_id}: ${msg.amount} via {msg.payment_method}"
+    log.info(
+        "[ORDER ROUTER] Processing payment for order %s: $%s via %s",
+        msg.order_id, msg.amount, msg.payment_method,
     )
     return {"status": "success", "action": "process_payment", "order_id": msg.order_id}
 
@@ -148,7 +166,7 @@ async def handle_process_payment(msg: ProcessPayment):
 # System Handlers (in system_router)
 @system_router.route(DatabaseBackup)
 async def handle_database_backup(msg: DatabaseBackup):
-    print(f"[SYSTEM ROUTER] Creating {msg.backup_type} backup of '{msg.database_name}'")
+    log.info("[SYSTEM ROUTER] Creating %s backup of '%s'", msg.backup_type, msg.database_name)
     return {
         "status": "success",
         "action": "database_backup",
@@ -158,7 +176,7 @@ async def handle_database_backup(msg: DatabaseBackup):
 
 @system_router.route(SendNotification)
 async def handle_send_notification(msg: SendNotification):
-    print(f"[SYSTEM ROUTER] Sending {msg.channel} to {msg.recipient}: '{msg.message}'")
+    log.info("[SYSTEM ROUTER] Sending %s to %s: '%s'", msg.channel, msg.recipient, msg.message)
     return {
         "status": "success",
         "action": "send_notification",
@@ -168,8 +186,9 @@ async def handle_send_notification(msg: SendNotification):
 
 @system_router.route(GenerateReport)
 async def handle_generate_report(msg: GenerateReport):
-    print(
-        f"[SYSTEM ROUTER] Generating {msg.report_type} report for {msg.date_range} ({msg.format})"
+    log.info(
+        "[SYSTEM ROUTER] Generating %s report for %s (%s)",
+        msg.report_type, msg.date_range, msg.format,
     )
     return {
         "status": "success",
@@ -186,10 +205,15 @@ class HealthCheck(SQSEvent):
 
 @app.route(HealthCheck)
 async def handle_health_check(msg: HealthCheck):
-    print(f"[MAIN APP] Health check for service: {msg.service}")
+    log.info("[MAIN APP] Health check for service: %s", msg.service)
     return {"status": "success", "action": "health_check", "service": msg.service}
 
 
+# All routes are registered above; build the dispatch tables at import
+# time so the first record pays a plain dict lookup
+app.freeze()
+
+
 def lambda_handler(event, context):
     return app.handler(event, context)
 
@@ -257,13 +281,16 @@ def test_pydantic_nested_routing():
         },
     ]
 
-    for i, test_case in enumerate(test_cases, 1):
+    # Serialize every case once, outside the dispatch loop
+    bodies = [json_dumps(test_case) for test_case in test_cases]
+
+    for i, (test_case, body) in enumerate(zip(test_cases, bodies), 1):
         print(f"\n--- Test Case {i}: {test_case['type']} ---")
         event = {
             "Records": [
                 {
                     "messageId": f"msg-{i}",
-                    "body": json.dumps(test_case),
+                    "body": body,
                     "attributes": {},
                 }
             ]
@@ -274,4 +301,5 @@ def test_pydantic_nested_routing():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     test_pydantic_nested_routing()
@@ -1,5 +1,17 @@
+import logging
+from types import MappingProxyType
+
 from fastsqs import FastSQS, SQSEvent, QueueType
 
+# Handler output goes through the logging framework, one call per record
+# instead of several line-buffered print writes
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+# Shared read-only default for records without FIFO attributes; avoids
+# allocating a fresh empty dict per handler call
+_EMPTY_FIFO = MappingProxyType({})
+
 
 class OrderCreated(SQSEvent):
     order_id: str
@@ -19,71 +31,93 @@ fifo_app = FastSQS(
 
 @fifo_app.route(OrderCreated)
 async def handle_order_created(msg: OrderCreated, ctx):
-    queue_type = ctx.get("queueType")
-    fifo_info = ctx.get("fifoInfo", {})
+    # Bind ctx.get once; each extra .get is a bound-method lookup per call
+    get = ctx.get
+    queue_type = get("queueType")
+    fifo_info = get("fifoInfo") or _EMPTY_FIFO
+    message_id = get("messageId")
 
     if queue_type == "fifo":
-        message_group = fifo_info.get("messageGroupId")
-        dedup_id = fifo_info.get("messageDeduplicationId")
-        print(f"Processing order in FIFO queue, group: {message_group}")
-        print(f"Deduplication ID: {dedup_id}")
+        log.info(
+            "Order created: %s (message %s) in FIFO queue, group: %s, dedup: %s",
+            msg.order_id,
+            message_id,
+            fifo_info.get("messageGroupId"),
+            fifo_info.get("messageDeduplicationId"),
+        )
     else:
-        print("Processing order in Standard queue")
-
-    print(f"Order created: {msg.order_id}")
-    print(f"Message ID: {ctx.get('messageId')}")
+        log.info(
+            "Order created: %s (message %s) in Standard queue",
+            msg.order_id,
+            message_id,
+        )
 
 
 @fifo_app.route(OrderUpdated)
 async def handle_order_updated(msg: OrderUpdated, ctx):
-    queue_type = ctx.get("queueType")
-    fifo_info = ctx.get("fifoInfo", {})
+    get = ctx.get
+    queue_type = get("queueType")
+    fifo_info = get("fifoInfo") or _EMPTY_FIFO
+    message_id = get("messageId")
 
     if queue_type == "fifo":
-        message_group = fifo_info.get("messageGroupId")
-        dedup_id = fifo_info.get("messageDeduplicationId")
-        print(f"Processing order update in FIFO queue, group: {message_group}")
-        print(f"Deduplication ID: {dedup_id}")
+        log.info(
+            "Order updated: %s (message %s) in FIFO queue, group: %s, dedup: %s",
+            msg.order_id,
+            message_id,
+            fifo_info.get("messageGroupId"),
+            fifo_info.get("messageDeduplicationId"),
+        )
     else:
-        print("Processing order update in Standard queue")
+        log.info(
+            "Order updated: %s (message %s) in Standard queue",
+            msg.order_id,
+            message_id,
+        )
+
 
-    print(f"Order updated: {msg.order_id}")
-    print(f"Message ID: {ctx.get('messageId')}")
+# All routes are registered above; build the dispatch tables at import
+# time so the first record pays a plain dict lookup
+fifo_app.freeze()
 
 
 def lambda_handler(event, context):
     return fifo_app.handler(event, context)
 
 
-if __name__ == "__main__":
-    event = {
-        "Records": [
-            {
-                "messageId": "msg-fifo-001",
-                "body": '{"type": "order_created", "order_id": "order-123"}',
-                "attributes": {
-                    "messageGroupId": "customer-001",
-                    "messageDeduplicationId": "dedup-001",
-                },
+# Module-level fixture: local benchmark loops that call lambda_handler
+# repeatedly measure dispatch cost, not test-event construction
+_SAMPLE_EVENT = {
+    "Records": [
+        {
+            "messageId": "msg-fifo-001",
+            "body": '{"type": "order_created", "order_id": "order-123"}',
+            "attributes": {
+                "messageGroupId": "customer-001",
+                "messageDeduplicationId": "dedup-001",
             },
-            {
-                "messageId": "msg-fifo-002",
-                "body": '{"type": "order_updated", "order_id": "order-123"}',
-                "attributes": {
-                    "messageGroupId": "customer-001",
-                    "messageDeduplicationId": "dedup-002",
-                },
+        },
+        {
+            "messageId": "msg-fifo-002",
+            "body": '{"type": "order_updated", "order_id": "order-123"}',
+            "attributes": {
+                "messageGroupId": "customer-001",
+                "messageDeduplicationId": "dedup-002",
             },
-            {
-                "messageId": "msg-fifo-003",
-                "body": '{"type": "order_created", "order_id": "order-456"}',
-                "attributes": {
-                    "messageGroupId": "customer-002",
-                    "messageDeduplicationId": "dedup-003",
-                },
+        },
+        {
+            "messageId": "msg-fifo-003",
+            "body": '{"type": "order_created", "order_id": "order-456"}',
+            "attributes": {
+                "messageGroupId": "customer-002",
+                "messageDeduplicationId": "dedup-003",
             },
-        ]
-    }
-    
-    result = lambda_handler(event, None)
+        },
+    ]
+}
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    result = lambda_handler(_SAMPLE_EVENT, None)
     print(f"Processing complete. Result: {result}")
@@ -1,5 +1,17 @@
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from fastsqs import FastSQS, SQSEvent
 import asyncio
+import logging
+
+# Handler output goes through the logging framework, one call per record
+# instead of several line-buffered print writes
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
 
 
 class OrderCreated(SQSEvent):
@@ -20,38 +32,45 @@ standard_app = FastSQS(
 
 @standard_app.route(OrderCreated)
 async def handle_order_created(msg: OrderCreated):
-    print("Processing order in Standard queue (parallel processing)")
-    print(f"Order created: {msg.order_id}")
+    log.info("Order created: %s (Standard queue, parallel processing)", msg.order_id)
 
 @standard_app.route(OrderUpdated)
 async def handle_order_updated(msg: OrderUpdated):
-    print("Processing order update in Standard queue (parallel processing)")
-    print(f"Order updated: {msg.order_id}")
+    log.info("Order updated: %s (Standard queue, parallel processing)", msg.order_id)
+
+# All routes are registered above; build the dispatch tables at import
+# time so the first record pays a plain dict lookup
+standard_app.freeze()
+
 
 def lambda_handler(event, context):
     return standard_app.handler(event, context)
 
 
+# Module-level fixture: local benchmark loops that call lambda_handler
+# repeatedly measure dispatch cost, not test-event construction
+_SAMPLE_EVENT = {
+    "Records": [
+        {
+            "messageId": "msg-001",
+            "body": '{"type": "order_created", "order_id": "order-123"}',
+            "attributes": {},
+        },
+        {
+            "messageId": "msg-002",
+            "body": '{"type": "order_updated", "order_id": "order-123"}',
+            "attributes": {},
+        },
+        {
+            "messageId": "msg-003",
+            "body": '{"type": "order_created", "order_id": "order-456"}',
+            "attributes": {},
+        },
+    ]
+}
+
+
 if __name__ == "__main__":
-    event = {
-        "Records": [
-            {
-                "messageId": "msg-001",
-                "body": '{"type": "order_created", "order_id": "order-123"}',
-                "attributes": {},
-            },
-            {
-                "messageId": "msg-002",
-                "body": '{"type": "order_updated", "order_id": "order-123"}',
-                "attributes": {},
-            },
-            {
-                "messageId": "msg-003",
-                "body": '{"type": "order_created", "order_id": "order-456"}',
-                "attributes": {},
-            },
-        ]
-    }
-
-    result = lambda_handler(event, None)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    result = lambda_handler(_SAMPLE_EVENT, None)
     print(f"Processing complete. Result: {result}")
\ No newline at end of file
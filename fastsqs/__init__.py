@@ -15,6 +15,7 @@ from .middleware import (
     IdempotencyMiddleware,
     IdempotencyStore,
     MemoryIdempotencyStore,
+    BloomIdempotencyStore,
     DynamoDBIdempotencyStore,
     ErrorHandlingMiddleware,
     RetryConfig,
@@ -49,6 +50,7 @@ __all__ = [
     "IdempotencyMiddleware",
     "IdempotencyStore",
     "MemoryIdempotencyStore",
+    "BloomIdempotencyStore",
     "DynamoDBIdempotencyStore",
     "ErrorHandlingMiddleware",
     "RetryConfig",
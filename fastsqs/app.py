@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import sys
 from typing import Any, Callable, Dict, List, Optional, Type
 
 from .events import SQSEvent
 from .types import QueueType, Handler
 from .exceptions import RouteNotFound, InvalidMessage
-from .middleware import Middleware, run_middlewares
+from .middleware import Middleware, compose_middleware_chain
 from .middleware.idempotency import IdempotencyHit
 from .middleware.logging import LoggingMiddleware
 from .routing import SQSRouter
-from .utils import group_records_by_message_group
+from .utils import group_records_by_message_group, json_loads
 from .presets import MiddlewarePreset
 from .logger import Logger
 from .telemetry import Telemetry
@@ -68,6 +68,9 @@ class FastSQS:
 
         self._routers: List[SQSRouter] = []
         self._middlewares: List[Middleware] = []
+        self._dispatch_index: Optional[Dict[str, SQSRouter]] = None
+        self._middleware_chain = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     def route(
         self,
@@ -101,6 +104,41 @@ class FastSQS:
             router: SQSRouter instance to include
         """
         self._routers.append(router)
+        self._dispatch_index = None
+
+    def _build_dispatch_index(self) -> Dict[str, SQSRouter]:
+        """Flatten pydantic routes from all routers into one lookup table.
+
+        Maps every registered message type (including flexible matching
+        variants) to the router that owns it, so record dispatch is a
+        single dict lookup instead of a linear scan over routers.
+
+        Returns:
+            Dictionary mapping message type strings to routers
+        """
+        index: Dict[str, SQSRouter] = {}
+        for router in (self._main_router, *self._routers):
+            for message_type in router._pydantic_routes:
+                index.setdefault(message_type, router)
+            for variant in router._route_lookup:
+                index.setdefault(variant, router)
+        return index
+
+    def freeze(self) -> None:
+        """Precompile dispatch tables once all routes are registered.
+
+        Optional: call after the last route/include_router/add_middleware at
+        module import so the flattened dispatch index and composed middleware
+        chain are built during cold start instead of on the first record.
+        Registration after freeze() still works — it simply invalidates the
+        tables and they are rebuilt lazily.
+        """
+        self._dispatch_index = self._build_dispatch_index()
+        self._middleware_chain = compose_middleware_chain(self._middlewares)
+
+    def build(self) -> None:
+        """Alias for freeze, mirroring the add_middleware/use pairing."""
+        self.freeze()
 
     def add_middleware(self, middleware: Middleware) -> None:
         """Add a middleware to the application.
@@ -110,6 +148,7 @@ class FastSQS:
         """
         middleware._app = self
         self._middlewares.append(middleware)
+        self._middleware_chain = None
 
     def use(self, middleware: Middleware) -> None:
         """Alias for add_middleware.
@@ -188,23 +227,36 @@ class FastSQS:
             InvalidMessage: If message format is invalid
             RouteNotFound: If no handler found for message
         """
-        body_str = record.get("body", "")
+        body = record.get("body", "")
         msg_id = record.get("messageId") or record.get("message_id") or "UNKNOWN"
 
         self._log("info", f"Starting record processing", msg_id=msg_id)
-        self._log(
-            "debug",
-            f"Raw body",
-            msg_id=msg_id,
-            body=body_str[:500] + ("..." if len(body_str) > 500 else ""),
-        )
+        if self.debug and not isinstance(body, (dict, list)):
+            # Bodies may be bytes/memoryview (e.g. pre-decoded transports);
+            # only build a str preview when debug logging will emit it.
+            preview = body[:500]
+            if isinstance(preview, (bytes, bytearray, memoryview)):
+                preview = bytes(preview).decode("utf-8", errors="replace")
+            self._log(
+                "debug",
+                f"Raw body",
+                msg_id=msg_id,
+                body=preview + ("..." if len(body) > 500 else ""),
+            )
 
         try:
-            payload = json.loads(body_str) if body_str else {}
+            if isinstance(body, (dict, list)):
+                # Already-decoded bodies (local test harnesses, upstream
+                # pre-parsing) skip the serialize/parse round trip
+                payload = body
+            else:
+                # json_loads hands str/bytes/memoryview to the parser
+                # without an intermediate copy
+                payload = json_loads(body) if body else {}
             if not isinstance(payload, dict):
                 raise InvalidMessage("Message body must be a JSON object")
             self._log("debug", f"Parsed payload", msg_id=msg_id, payload=payload)
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             self._log("error", f"JSON decode error", msg_id=msg_id, error=str(e))
             raise InvalidMessage(f"Invalid JSON in message body: {e}")
 
@@ -228,11 +280,13 @@ class FastSQS:
         err: Optional[Exception] = None
         result: Any = None
 
+        if self._middleware_chain is None:
+            self._middleware_chain = compose_middleware_chain(self._middlewares)
+        run_before, run_after = self._middleware_chain
+
         try:
             self._log("debug", f"Running 'before' middleware chain", msg_id=msg_id)
-            await run_middlewares(
-                self._middlewares, "before", payload, record, context, ctx
-            )
+            await run_before(payload, record, context, ctx)
             self._log("debug", f"'before' middleware chain completed", msg_id=msg_id)
         except IdempotencyHit as idempotency_hit:
             self._log(
@@ -250,22 +304,50 @@ class FastSQS:
                 )
             ctx["idempotency_result"] = idempotency_hit.result
             ctx["idempotency_hit"] = True
-            await run_middlewares(
-                self._middlewares, "after", payload, record, context, ctx, None
-            )
+            await run_after(payload, record, context, ctx, None)
             return idempotency_hit.result
 
         try:
             handled = False
 
+            if self._dispatch_index is None:
+                self._dispatch_index = self._build_dispatch_index()
+
+            message_type = payload.get(self.message_type_key)
+            target_router = None
+            if isinstance(message_type, str):
+                # Index keys are interned at registration; interning the
+                # freshly decoded discriminator makes the probe (and the
+                # router's own lookups downstream) a pointer compare. The
+                # length guard keeps junk values out of the intern table.
+                if len(message_type) <= 64:
+                    message_type = sys.intern(message_type)
+                target_router = self._dispatch_index.get(message_type)
+
+            if target_router is not None:
+                self._log(
+                    "debug",
+                    f"Dispatch index hit",
+                    msg_id=msg_id,
+                    message_type=message_type,
+                )
+                if await target_router.dispatch(
+                    payload, record, context, ctx, root_payload=payload
+                ):
+                    handled = True
+                    result = ctx.get("handler_result")
+
             # Try main router first
-            self._log("debug", f"Trying main router", msg_id=msg_id)
-            if await self._main_router.dispatch(
-                payload, record, context, ctx, root_payload=payload
-            ):
-                self._log("debug", f"Main router handled the message", msg_id=msg_id)
-                handled = True
-                result = ctx.get("handler_result")
+            if not handled:
+                self._log("debug", f"Trying main router", msg_id=msg_id)
+                if await self._main_router.dispatch(
+                    payload, record, context, ctx, root_payload=payload
+                ):
+                    self._log(
+                        "debug", f"Main router handled the message", msg_id=msg_id
+                    )
+                    handled = True
+                    result = ctx.get("handler_result")
 
             if not handled and self._routers:
                 self._log(
@@ -326,9 +408,7 @@ class FastSQS:
             raise
         finally:
             self._log("debug", f"Running 'after' middleware chain", msg_id=msg_id)
-            await run_middlewares(
-                self._middlewares, "after", payload, record, context, ctx, err
-            )
+            await run_after(payload, record, context, ctx, err)
             self._log("debug", f"'after' middleware chain completed", msg_id=msg_id)
 
         self._log("info", f"Record processing completed successfully", msg_id=msg_id)
@@ -349,6 +429,11 @@ class FastSQS:
         Returns:
             Dictionary with batch failure information
         """
+        # Build once per container: registration only clears these, so warm
+        # invocations pay a pair of None checks
+        if self._dispatch_index is None or self._middleware_chain is None:
+            self.freeze()
+
         Logger.set_lambda_context(
             lambda_context=context,
             custom_fields={
@@ -391,18 +476,28 @@ class FastSQS:
             record_count=len(records),
         )
 
-        semaphore = asyncio.Semaphore(self.max_concurrent_messages)
+        if len(records) <= self.max_concurrent_messages:
+            # The semaphore can never block at SQS batch sizes within the
+            # concurrency limit, so skip its acquire/release per record
+            tasks = [
+                asyncio.create_task(self._handle_record_safe(rec, context))
+                for rec in records
+            ]
+        else:
+            semaphore = asyncio.Semaphore(self.max_concurrent_messages)
 
-        async def process_with_semaphore(record):
-            async with semaphore:
-                return await self._handle_record_safe(record, context)
+            async def process_with_semaphore(record):
+                async with semaphore:
+                    return await self._handle_record_safe(record, context)
 
-        tasks = [asyncio.create_task(process_with_semaphore(rec)) for rec in records]
+            tasks = [
+                asyncio.create_task(process_with_semaphore(rec)) for rec in records
+            ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        for i, result in enumerate(results):
+        for record, result in zip(records, results):
+            msg_id = record.get("messageId", "UNKNOWN")
             if isinstance(result, Exception):
-                msg_id = records[i].get("messageId", "UNKNOWN")
                 self._log(
                     "error",
                     f"Record failed",
@@ -417,7 +512,6 @@ class FastSQS:
                 if self.enable_partial_batch_failure:
                     failures.append({"itemIdentifier": msg_id})
             else:
-                msg_id = records[i].get("messageId", "UNKNOWN")
                 self._log("debug", f"Record succeeded", msg_id=msg_id)
 
         self._log(
@@ -526,27 +620,33 @@ class FastSQS:
 
     def handler(self, event: dict, context: Any) -> dict:
         """Main synchronous handler entry point for Lambda.
-        
+
+        Reuses a persistent event loop across invocations so warm Lambda
+        containers skip per-call loop setup and teardown. The loop honors
+        whatever event loop policy is installed (e.g. uvloop).
+
         Args:
             event: SQS event dictionary
             context: Lambda context object
-            
+
         Returns:
             Dictionary with batch failure information
-            
+
         Raises:
             RuntimeError: If called from within an event loop
         """
         try:
             asyncio.get_running_loop()
-            raise RuntimeError(
-                "FastSQS handler called from within event loop. Use async_handler() for testing."
-            )
-        except RuntimeError as e:
-            if "no running event loop" in str(e):
-                return asyncio.run(self._handle_event(event, context))
-            else:
-                raise
+        except RuntimeError:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                # Register as the thread's loop so libraries that call
+                # asyncio.get_event_loop() join it instead of making their own
+                asyncio.set_event_loop(self._loop)
+            return self._loop.run_until_complete(self._handle_event(event, context))
+        raise RuntimeError(
+            "FastSQS handler called from within event loop. Use async_handler() for testing."
+        )
 
     async def async_handler(self, event: dict, context: Any) -> dict:
         """Asynchronous handler entry point for testing.
@@ -1,7 +1,30 @@
 from pydantic import BaseModel, model_validator
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Optional, Set, Tuple
 import re
 
+_ALIAS_CACHE: Dict[type, Tuple[Dict[str, str], Dict[str, str], frozenset]] = {}
+_MESSAGE_TYPE_CACHE: Dict[type, str] = {}
+_MESSAGE_TYPE_VARIANTS_CACHE: Dict[type, frozenset] = {}
+
+# Compiled once at import; splits CamelCase class names at each
+# uppercase boundary for snake/kebab-case conversion
+_CAMEL_BOUNDARY = re.compile(r'(?<!^)(?=[A-Z])')
+
+# Payload key names repeat across records, so the lower/replace work is
+# memoized; the size cap keeps adversarial key sets from growing it
+_NORMALIZED_KEY_CACHE: Dict[str, str] = {}
+_NORMALIZED_KEY_CACHE_MAX = 4096
+
+
+def _normalize_key(key: str) -> str:
+    """Normalize a key for fuzzy field matching."""
+    normalized = _NORMALIZED_KEY_CACHE.get(key)
+    if normalized is None:
+        normalized = key.lower().replace('_', '').replace('-', '')
+        if len(_NORMALIZED_KEY_CACHE) < _NORMALIZED_KEY_CACHE_MAX:
+            _NORMALIZED_KEY_CACHE[key] = normalized
+    return normalized
+
 
 class SQSEvent(BaseModel):
     """Base class for SQS event models with automatic field normalization.
@@ -10,92 +33,134 @@ class SQSEvent(BaseModel):
     (camelCase, snake_case, kebab-case) and generates message type variants.
     """
     
+    @classmethod
+    def _field_aliases(cls) -> Tuple[Dict[str, str], Dict[str, str], frozenset]:
+        """Get the compiled alias tables for this class, building them once.
+
+        Returns:
+            Tuple of (camelCase alias -> field name, normalized key ->
+            field name, frozenset of declared field names)
+        """
+        aliases = _ALIAS_CACHE.get(cls)
+        if aliases is None:
+            camel_to_field: Dict[str, str] = {}
+            normalized_to_field: Dict[str, str] = {}
+            field_names: frozenset = frozenset()
+            if hasattr(cls, 'model_fields'):
+                for field_name in cls.model_fields:
+                    parts = field_name.split('_')
+                    if len(parts) > 1:
+                        camel_case = parts[0] + ''.join(word.capitalize() for word in parts[1:])
+                        camel_to_field[camel_case] = field_name
+                    normalized_to_field[_normalize_key(field_name)] = field_name
+                field_names = frozenset(cls.model_fields)
+            aliases = (camel_to_field, normalized_to_field, field_names)
+            _ALIAS_CACHE[cls] = aliases
+        return aliases
+
     @model_validator(mode='before')
     @classmethod
     def normalize_field_names(cls, data: Any) -> Any:
         """Normalize field names from different naming conventions.
-        
+
+        Uses per-class alias tables compiled on first validation, so each
+        message pays two dict lookups per key instead of rebuilding the
+        camelCase/normalized forms every time.
+
         Args:
             data: Input data dictionary
-            
+
         Returns:
             Normalized data dictionary
         """
         if not isinstance(data, dict):
             return data
-            
-        model_fields = set()
-        if hasattr(cls, 'model_fields'):
-            model_fields = set(cls.model_fields.keys())
-        
+
+        camel_to_field, normalized_to_field, field_names = cls._field_aliases()
+
+        # Fast path: payloads already keyed by the declared field names
+        # need no aliasing and no defensive copy
+        if data.keys() <= field_names:
+            return data
+
         normalized_data = dict(data)
-        
-        for field_name in model_fields:
-            if field_name not in normalized_data:
-                parts = field_name.split('_')
-                if len(parts) > 1:
-                    camel_case = parts[0] + ''.join(word.capitalize() for word in parts[1:])
-                    if camel_case in normalized_data:
-                        normalized_data[field_name] = normalized_data[camel_case]
-                        continue
-                
-                field_normalized = field_name.lower().replace('_', '').replace('-', '')
-                for key in data:
-                    key_normalized = key.lower().replace('_', '').replace('-', '')
-                    if key != field_name and key_normalized == field_normalized:
-                        normalized_data[field_name] = normalized_data[key]
-                        break
-        
+
+        for camel_case, field_name in camel_to_field.items():
+            if field_name not in normalized_data and camel_case in normalized_data:
+                normalized_data[field_name] = normalized_data[camel_case]
+
+        for key in data:
+            field_name = normalized_to_field.get(_normalize_key(key))
+            if field_name and field_name not in normalized_data and key != field_name:
+                normalized_data[field_name] = normalized_data[key]
+
         return normalized_data
     
     @classmethod
     def get_message_type(cls) -> str:
         """Get the primary message type for this event class.
-        
+
+        The derived name is cached per class, so repeated calls skip the
+        regex conversion.
+
         Returns:
             Snake_case version of the class name
         """
+        cached = _MESSAGE_TYPE_CACHE.get(cls)
+        if cached is not None:
+            return cached
         name = cls.__name__
-        return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
-    
+        message_type = _CAMEL_BOUNDARY.sub('_', name).lower()
+        _MESSAGE_TYPE_CACHE[cls] = message_type
+        return message_type
+
     @classmethod
     def get_message_type_variants(cls) -> Set[str]:
         """Get all possible message type variants for flexible matching.
-        
+
         Returns:
             Set of message type variants in different naming conventions
         """
+        cached = _MESSAGE_TYPE_VARIANTS_CACHE.get(cls)
+        if cached is not None:
+            return set(cached)
+
         base_name = cls.__name__
         
         variants = set()
         
         variants.add(base_name)
         
-        snake_case = re.sub(r'(?<!^)(?=[A-Z])', '_', base_name).lower()
+        snake_case = _CAMEL_BOUNDARY.sub('_', base_name).lower()
         variants.add(snake_case)
         
         camel_case = base_name[0].lower() + base_name[1:] if base_name else ""
         variants.add(camel_case)
         
-        kebab_case = re.sub(r'(?<!^)(?=[A-Z])', '-', base_name).lower()
+        kebab_case = _CAMEL_BOUNDARY.sub('-', base_name).lower()
         variants.add(kebab_case)
         
         variants.add(base_name.lower())
-        
+
         variants.add(base_name.upper())
-        
+
+        _MESSAGE_TYPE_VARIANTS_CACHE[cls] = frozenset(variants)
         return variants
     
     @classmethod
     def from_sqs_record(cls, record: Dict[str, Any]) -> "SQSEvent":
         """Create an event instance from an SQS record.
-        
+
+        The body goes straight to pydantic-core's JSON parser, which
+        builds the model in one pass without an intermediate Python dict.
+
         Args:
             record: SQS record dictionary
-            
+
         Returns:
             Validated event instance
         """
-        import json
-        body = json.loads(record.get("body", "{}"))
-        return cls.model_validate(body)
+        body = record.get("body", "{}")
+        if isinstance(body, memoryview):
+            body = body.tobytes()
+        return cls.model_validate_json(body)
@@ -1,21 +1,23 @@
 """Middleware components for FastSQS."""
 
-from .base import Middleware, run_middlewares
+from .base import Middleware, run_middlewares, compose_middleware_chain
 from .timing import TimingMsMiddleware
 from .logging import LoggingMiddleware
-from .idempotency import IdempotencyMiddleware, IdempotencyStore, MemoryIdempotencyStore, DynamoDBIdempotencyStore, IdempotencyHit
+from .idempotency import IdempotencyMiddleware, IdempotencyStore, MemoryIdempotencyStore, BloomIdempotencyStore, DynamoDBIdempotencyStore, IdempotencyHit
 from .error_handling import ErrorHandlingMiddleware, RetryConfig, CircuitBreaker, DeadLetterQueueMiddleware
 from .visibility import VisibilityTimeoutMonitor, ProcessingTimeMiddleware, QueueMetricsMiddleware
 from .parallelization import ParallelizationMiddleware, ConcurrencyLimiter, ResourcePool, ParallelizationConfig, LoadBalancingMiddleware
 
 __all__ = [
     "run_middlewares",
+    "compose_middleware_chain",
     "Middleware",
     "TimingMsMiddleware", 
     "LoggingMiddleware",
     "IdempotencyMiddleware",
     "IdempotencyStore", 
     "MemoryIdempotencyStore",
+    "BloomIdempotencyStore",
     "DynamoDBIdempotencyStore",
     "IdempotencyHit",
     "ErrorHandlingMiddleware",
@@ -77,6 +77,73 @@ def call_middleware_hook(mw: Middleware, hook: str, *args) -> Awaitable[None]:
     return _wrap()
 
 
+async def _noop_before(payload: dict, record: dict, context: Any, ctx: dict) -> None:
+    return None
+
+
+async def _noop_after(
+    payload: dict,
+    record: dict,
+    context: Any,
+    ctx: dict,
+    error: Optional[Exception] = None,
+) -> None:
+    return None
+
+
+def _overridden_hook(mw: Middleware, hook: str):
+    """Return the bound hook if the middleware actually overrides it."""
+    if getattr(type(mw), hook, None) is getattr(Middleware, hook):
+        return None
+    return getattr(mw, hook, None)
+
+
+def compose_middleware_chain(mws: List[Middleware]):
+    """Pre-compose a middleware list into bound before/after runners.
+
+    Hook resolution and the after-phase reversal happen once here, so
+    each record dispatch iterates tuples of bound methods instead of
+    re-resolving hooks through getattr per call. Middlewares that keep
+    the base class's no-op before/after are dropped from the chain, and
+    an empty chain collapses to shared no-op coroutines.
+
+    Args:
+        mws: List of middleware instances
+
+    Returns:
+        Tuple of (run_before, run_after) async callables
+    """
+    before_hooks = tuple(
+        hook for hook in (_overridden_hook(mw, "before") for mw in mws) if hook
+    )
+    after_hooks = tuple(
+        hook for hook in (_overridden_hook(mw, "after") for mw in reversed(mws)) if hook
+    )
+
+    if not before_hooks and not after_hooks:
+        return _noop_before, _noop_after
+
+    async def run_before(payload: dict, record: dict, context: Any, ctx: dict) -> None:
+        for hook in before_hooks:
+            res = hook(payload, record, context, ctx)
+            if inspect.isawaitable(res):
+                await res
+
+    async def run_after(
+        payload: dict,
+        record: dict,
+        context: Any,
+        ctx: dict,
+        error: Optional[Exception] = None,
+    ) -> None:
+        for hook in after_hooks:
+            res = hook(payload, record, context, ctx, error)
+            if inspect.isawaitable(res):
+                await res
+
+    return run_before, run_after
+
+
 async def run_middlewares(
     mws: List[Middleware],
     when: str,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import time
 import asyncio
+import inspect
 from typing import Any, Dict, List, Optional, Callable, Union
 from .base import Middleware
 
@@ -151,21 +152,27 @@ class ErrorHandlingMiddleware(Middleware):
         retry_config: Optional[RetryConfig] = None,
         circuit_breaker: Optional[CircuitBreaker] = None,
         dead_letter_handler: Optional[Callable[[dict, dict, Exception], None]] = None,
-        error_classifier: Optional[Callable[[Exception], str]] = None
+        error_classifier: Optional[Callable[[Exception], str]] = None,
+        visibility_extender: Optional[Callable[[dict, float], Any]] = None
     ):
         """Initialize error handling middleware.
-        
+
         Args:
             retry_config: Retry configuration
             circuit_breaker: Circuit breaker instance
             dead_letter_handler: Handler for messages that exhaust retries
             error_classifier: Function to classify errors as permanent/temporary
+            visibility_extender: Callback invoked with (record, delay_seconds)
+                when a retry is scheduled, e.g. to call ChangeMessageVisibility
+                so SQS redelivers after the backoff delay instead of the
+                Lambda waiting in-process
         """
         super().__init__()
         self.retry_config = retry_config or RetryConfig()
         self.circuit_breaker = circuit_breaker
         self.dead_letter_handler = dead_letter_handler
         self.error_classifier = error_classifier or self._default_error_classifier
+        self.visibility_extender = visibility_extender
     
     def _default_error_classifier(self, exception: Exception) -> str:
         error_type = type(exception).__name__
@@ -189,7 +196,7 @@ class ErrorHandlingMiddleware(Middleware):
         return "temporary"
     
     async def before(self, payload: dict, record: dict, context: Any, ctx: dict) -> None:
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
         
         # Enhanced logging for circuit breaker state
         if self.circuit_breaker:
@@ -210,7 +217,7 @@ class ErrorHandlingMiddleware(Middleware):
         self._log("debug", f"Initialized error handling context", msg_id=msg_id)
     
     async def after(self, payload: dict, record: dict, context: Any, ctx: dict, error: Optional[Exception]) -> None:
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
         
         if error is None:
             self._log("info", f"Processing succeeded", msg_id=msg_id)
@@ -223,7 +230,7 @@ class ErrorHandlingMiddleware(Middleware):
             await self._handle_error(payload, record, context, ctx, error)
     
     async def _handle_error(self, payload: dict, record: dict, context: Any, ctx: dict, error: Exception) -> None:
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
         error_type = self.error_classifier(error)
         
         self._log("debug", f"Error classification", msg_id=msg_id, error_type=error_type)
@@ -247,6 +254,7 @@ class ErrorHandlingMiddleware(Middleware):
             ctx["should_retry"] = True
             ctx["retry_delay"] = self.retry_config.get_delay(ctx["retry_attempt"])
             self._log("info", f"Will retry", msg_id=msg_id, delay=ctx['retry_delay'])
+            await self._defer_retry_to_sqs(record, ctx, msg_id)
         else:
             self._log("info", f"Will not retry", 
                      msg_id=msg_id, error_type=error_type,
@@ -264,6 +272,29 @@ class ErrorHandlingMiddleware(Middleware):
             
             ctx["should_retry"] = False
 
+    async def _defer_retry_to_sqs(self, record: dict, ctx: dict, msg_id: str) -> None:
+        """Hand the retry delay to SQS instead of waiting in-process.
+
+        When a visibility extender is configured, the exponential-backoff
+        delay is applied via the record's receipt handle (typically a
+        ChangeMessageVisibility call) and the failed message rides the normal
+        batchItemFailures path, so the Lambda returns immediately and SQS
+        redelivers after the delay.
+        """
+        if not self.visibility_extender or not record.get("receiptHandle"):
+            return
+        delay = ctx["retry_delay"]
+        try:
+            result = self.visibility_extender(record, delay)
+            if inspect.isawaitable(result):
+                await result
+            ctx["retry_via_redelivery"] = True
+            self._log("info", f"Retry deferred to SQS redelivery",
+                     msg_id=msg_id, visibility_timeout=int(delay))
+        except Exception as e:
+            self._log("warning", f"Failed to apply retry visibility timeout",
+                     msg_id=msg_id, error=str(e))
+
 
 class DeadLetterQueueMiddleware(Middleware):
     """Middleware for handling messages that cannot be processed.
@@ -293,7 +324,7 @@ class DeadLetterQueueMiddleware(Middleware):
     async def _default_dlq_handler(self, payload: dict, record: dict, error: Exception, ctx: dict) -> None:
         import json
         
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
         self._log("info", f"Creating dead letter queue record", msg_id=msg_id)
         
         dlq_record = {
@@ -316,7 +347,7 @@ class DeadLetterQueueMiddleware(Middleware):
                  msg_id=msg_id, dlq_record=dlq_record)
     
     async def before(self, payload: dict, record: dict, context: Any, ctx: dict) -> None:
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
         self._log("debug", f"Starting DLQ monitoring", msg_id=msg_id)
         
         if self.max_processing_time:
@@ -325,7 +356,7 @@ class DeadLetterQueueMiddleware(Middleware):
                      msg_id=msg_id, timeout=self.max_processing_time)
 
     async def after(self, payload: dict, record: dict, context: Any, ctx: dict, error: Optional[Exception]) -> None:
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
         
         if self.max_processing_time:
             processing_time = time.time() - ctx.get("dlq_start_time", 0)
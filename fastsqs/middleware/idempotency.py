@@ -4,15 +4,29 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import json
 import logging
+import math
 import time
+import zlib
+from collections import OrderedDict
 from decimal import Decimal
 from typing import Any, Dict, Optional, Set, Callable, Union
 from .base import Middleware
+from ..utils import json_dumps
 
 logger = logging.getLogger(__name__)
 
+try:
+    import xxhash
+
+    _default_payload_digest = xxhash.xxh3_64_hexdigest
+except ImportError:
+    xxhash = None
+
+    def _default_payload_digest(data: bytes) -> str:
+        """Hash payload bytes with sha256 when xxhash is not installed."""
+        return hashlib.sha256(data).hexdigest()
+
 
 def _convert_floats_to_decimal(obj: Any) -> Any:
     """Convert float values to Decimal for DynamoDB compatibility.
@@ -187,6 +201,77 @@ class MemoryIdempotencyStore(IdempotencyStore):
         return False
 
 
+class BloomIdempotencyStore(MemoryIdempotencyStore):
+    """In-memory idempotency store with bounded memory usage.
+
+    Uses a Bloom filter as a first tier to answer "definitely not seen"
+    in constant time and memory, backed by a bounded LRU dict for record
+    storage. Unlike MemoryIdempotencyStore, memory stays flat under
+    sustained throughput: the filter is fixed-size and the LRU tier
+    evicts the oldest records once full.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        fp_rate: float = 1e-4,
+        max_entries: int = 10_000,
+    ):
+        """Initialize Bloom-filtered store.
+
+        Args:
+            capacity: Expected number of distinct keys, used to size the filter
+            fp_rate: Target false-positive rate for the Bloom filter
+            max_entries: Maximum number of records kept in the LRU tier
+        """
+        super().__init__()
+        self._store: Dict[str, Dict[str, Any]] = OrderedDict()
+        self.max_entries = max_entries
+
+        bit_count = max(8, int(-capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+        self._bit_count = bit_count
+        self._bits = bytearray((bit_count + 7) // 8)
+        self._hash_count = max(1, round((bit_count / capacity) * math.log(2)))
+
+    def _bit_positions(self, key: str) -> list:
+        # Two chained CRC32s drive the usual double-hashing scheme; the
+        # C-level crc is far cheaper than a cryptographic digest and a
+        # dedup filter doesn't need collision resistance
+        data = key.encode()
+        h1 = zlib.crc32(data)
+        h2 = zlib.crc32(data, h1) | 1
+        return [(h1 + i * h2) % self._bit_count for i in range(self._hash_count)]
+
+    def _bloom_add(self, key: str) -> None:
+        for pos in self._bit_positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def _bloom_might_contain(self, key: str) -> bool:
+        for pos in self._bit_positions(key):
+            if not self._bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    async def get(
+        self, key: str, consistent_read: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        if not self._bloom_might_contain(key):
+            return None
+        record = await super().get(key, consistent_read)
+        if record is not None:
+            self._store.move_to_end(key)
+        return record
+
+    async def put(
+        self, key: str, value: Dict[str, Any], ttl_seconds: Optional[int] = None
+    ) -> None:
+        await super().put(key, value, ttl_seconds)
+        self._bloom_add(key)
+        self._store.move_to_end(key)
+        while len(self._store) > self.max_entries:
+            self._store.popitem(last=False)
+
+
 class DynamoDBIdempotencyStore(IdempotencyStore):
     """DynamoDB implementation of idempotency store.
     
@@ -525,6 +610,7 @@ class IdempotencyMiddleware(Middleware):
         fail_on_store_errors: bool = True,
         entity_lock_ttl_seconds: Optional[int] = None,
         sqs_visibility_timeout_seconds: int = 30,
+        hasher: Optional[Callable[[bytes], Union[int, str]]] = None,
     ):
         """Initialize idempotency middleware.
         
@@ -541,6 +627,9 @@ class IdempotencyMiddleware(Middleware):
             fail_on_store_errors: Whether to fail on store errors
             entity_lock_ttl_seconds: TTL for entity locks
             sqs_visibility_timeout_seconds: SQS visibility timeout
+            hasher: Function hashing payload bytes to a digest. Defaults to
+                xxhash.xxh3_64_hexdigest when xxhash is installed (the key
+                is a dedup key, not a security boundary), otherwise sha256
         """
         super().__init__()
         self.store = store or MemoryIdempotencyStore()
@@ -553,6 +642,7 @@ class IdempotencyMiddleware(Middleware):
         self.per_entity_sequencing = per_entity_sequencing
         self.entity_key_extractor = entity_key_extractor
         self.fail_on_store_errors = fail_on_store_errors
+        self.hasher = hasher or _default_payload_digest
 
         self.entity_lock_ttl_seconds = entity_lock_ttl_seconds or (
             sqs_visibility_timeout_seconds + 60
@@ -576,8 +666,8 @@ class IdempotencyMiddleware(Middleware):
         else:
             hash_data = payload
 
-        payload_str = json.dumps(hash_data, sort_keys=True, separators=(",", ":"))
-        return f"hash:{hashlib.sha256(payload_str.encode()).hexdigest()}"
+        payload_str = json_dumps(hash_data, sort_keys=True)
+        return f"hash:{self.hasher(payload_str.encode())}"
 
     def _get_entity_key(self, payload: dict) -> Optional[str]:
         if not self.per_entity_sequencing or not self.entity_key_extractor:
@@ -621,7 +711,7 @@ class IdempotencyMiddleware(Middleware):
     async def before(
         self, payload: dict, record: dict, context: Any, ctx: dict
     ) -> None:
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
 
         try:
             idempotency_key = self.key_generator(payload, record)
@@ -797,7 +887,7 @@ class IdempotencyMiddleware(Middleware):
     ) -> None:
         entity_key = ctx.get("entity_key")
         idempotency_key = ctx.get("idempotency_key")
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
 
         try:
             if ctx.get("idempotency_hit") or not ctx.get("reservation_created"):
@@ -928,6 +1018,8 @@ class IdempotencyMiddleware(Middleware):
 class IdempotencyHit(Exception):
     """Exception raised when a message has already been processed."""
 
+    __slots__ = ("key", "result", "timestamp")
+
     def __init__(self, key: str, result: Any = None, timestamp: Optional[float] = None):
         """Initialize idempotency hit exception.
         
@@ -945,6 +1037,8 @@ class IdempotencyHit(Exception):
 class IdempotencyInProgress(Exception):
     """Exception raised when a message is currently being processed."""
 
+    __slots__ = ("key", "created_at")
+
     def __init__(self, key: str, created_at: Optional[float] = None):
         """Initialize in-progress exception.
         
@@ -960,6 +1054,8 @@ class IdempotencyInProgress(Exception):
 class IdempotencyFailedPreviously(Exception):
     """Exception raised when a message failed processing previously."""
 
+    __slots__ = ("key", "error", "timestamp")
+
     def __init__(self, key: str, error: Any = None, timestamp: Optional[float] = None):
         """Initialize failed-previously exception.
         
@@ -977,6 +1073,8 @@ class IdempotencyFailedPreviously(Exception):
 class EntityLockAcquisitionFailed(Exception):
     """Exception raised when entity lock acquisition fails."""
 
+    __slots__ = ("entity_key", "idempotency_key")
+
     def __init__(self, entity_key: str, idempotency_key: str):
         """Initialize lock acquisition failure exception.
         
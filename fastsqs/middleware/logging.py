@@ -1,12 +1,12 @@
 """Logging middleware for structured message processing logs."""
 
-import json
 import time
 import traceback
+from functools import partial
 from typing import Callable, List, Optional
 
 from .base import Middleware
-from ..utils import shallow_mask
+from ..utils import json_dumps, shallow_mask
 from ..logger.logger import Logger
 
 class LoggingMiddleware(Middleware):
@@ -44,6 +44,14 @@ class LoggingMiddleware(Middleware):
         self.include_record = include_record
         self.include_context = include_context
         self.mask_fields = mask_fields or []
+        # Compiled once so each log call does a set intersection instead
+        # of scanning the field list per payload; with no mask fields the
+        # payload passes straight through
+        self._mask_set = frozenset(self.mask_fields)
+        if self._mask_set:
+            self._mask_payload = partial(shallow_mask, fields=self._mask_set)
+        else:
+            self._mask_payload = lambda payload: payload
         self.verbose = verbose
         
         if logger is None:
@@ -58,11 +66,11 @@ class LoggingMiddleware(Middleware):
                     self.logger = _custom_logger_func
                 except Exception:
                     def _default_logger(obj: dict) -> None:
-                        print(json.dumps(obj, ensure_ascii=False))
+                        print(json_dumps(obj))
                     self.logger = _default_logger
             else:
                 def _default_logger(obj: dict) -> None:
-                    print(json.dumps(obj, ensure_ascii=False))
+                    print(json_dumps(obj))
                 self.logger = _default_logger
         else:
             self.logger = logger
@@ -118,7 +126,7 @@ class LoggingMiddleware(Middleware):
         }
         
         if self.include_payload:
-            entry["payload"] = shallow_mask(payload, self.mask_fields)
+            entry["payload"] = self._mask_payload(payload)
         if self.include_record:
             entry["record"] = record
         if self.include_context:
@@ -175,7 +183,7 @@ class LoggingMiddleware(Middleware):
             }
         
         if self.include_payload:
-            entry["payload"] = shallow_mask(payload, self.mask_fields)
+            entry["payload"] = self._mask_payload(payload)
         if self.include_record:
             entry["record"] = record
         if self.include_context:
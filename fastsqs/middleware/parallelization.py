@@ -96,6 +96,7 @@ class ParallelizationConfig:
         self,
         max_concurrent_messages: int = 10,
         max_concurrent_per_group: int = 1,
+        use_asyncio: bool = True,
         use_thread_pool: bool = False,
         thread_pool_size: Optional[int] = None,
         batch_processing: bool = False,
@@ -103,10 +104,14 @@ class ParallelizationConfig:
         batch_timeout: float = 1.0
     ):
         """Initialize parallelization configuration.
-        
+
         Args:
             max_concurrent_messages: Maximum concurrent message processing
             max_concurrent_per_group: Maximum concurrent per FIFO group
+            use_asyncio: Prefer pure event-loop concurrency (semaphore-gated
+                asyncio.gather). When enabled, no thread pool is created even
+                if use_thread_pool is set; async I/O-bound handlers gain
+                nothing from extra threads and pay GIL/context-switch costs
             use_thread_pool: Whether to use thread pool for CPU-bound tasks
             thread_pool_size: Size of thread pool (None for default)
             batch_processing: Enable batch processing mode
@@ -115,6 +120,7 @@ class ParallelizationConfig:
         """
         self.max_concurrent_messages = max_concurrent_messages
         self.max_concurrent_per_group = max_concurrent_per_group
+        self.use_asyncio = use_asyncio
         self.use_thread_pool = use_thread_pool
         self.thread_pool_size = thread_pool_size or min(32, 5)
         self.batch_processing = batch_processing
@@ -150,7 +156,7 @@ class ParallelizationMiddleware(Middleware):
         )
         
         self.thread_pool: Optional[ThreadPoolExecutor] = None
-        if self.config.use_thread_pool:
+        if self.config.use_thread_pool and not self.config.use_asyncio:
             self.thread_pool = ThreadPoolExecutor(
                 max_workers=self.config.thread_pool_size,
                 thread_name_prefix="fastsqs-worker"
@@ -160,7 +166,7 @@ class ParallelizationMiddleware(Middleware):
         self.batch_timers: Dict[str, asyncio.Task] = {}
     
     async def before(self, payload: dict, record: dict, context: Any, ctx: dict) -> None:
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
         start_time = time.time()
         
         self._log("debug", f"Acquiring concurrency slot", 
@@ -179,7 +185,7 @@ class ParallelizationMiddleware(Middleware):
         ctx["_parallelization_middleware"] = self
     
     async def after(self, payload: dict, record: dict, context: Any, ctx: dict, error: Optional[Exception]) -> None:
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
         acquired_resources = ctx.get("acquired_resources", {})
         
         self._log("debug", f"Cleaning up resources", 
@@ -31,7 +31,7 @@ class TimingMsMiddleware(Middleware):
             context: Lambda context
             ctx: Processing context
         """
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
         ctx[self.store_key_start] = time.perf_counter_ns()
         self._log("debug", f"Processing started", msg_id=msg_id)
 
@@ -45,7 +45,7 @@ class TimingMsMiddleware(Middleware):
             ctx: Processing context
             error: Exception if processing failed
         """
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
         start = ctx.get(self.store_key_start)
         if start is not None:
             dur_ns = time.perf_counter_ns() - start
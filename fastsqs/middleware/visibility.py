@@ -34,6 +34,31 @@ class VisibilityTimeoutMonitor(Middleware):
         self.warning_threshold = warning_threshold
         self.extend_timeout_callback = extend_timeout_callback
         self.timeout_warning_callback = timeout_warning_callback or self._default_warning_callback
+        self.recommended_visibility_timeout: Optional[float] = None
+        self._undersized_timeout_logged = False
+
+    def _check_recommended_timeout(self, context: Any, visibility_timeout: float) -> None:
+        """Apply the AWS six-times-function-timeout sizing rule.
+
+        Reads the Lambda context's remaining time as the effective function
+        timeout and records 6x that as ``recommended_visibility_timeout``.
+        A visibility timeout below the recommendation risks SQS redelivering
+        messages that are still being processed, so it is logged once.
+        """
+        remaining = getattr(context, "get_remaining_time_in_millis", None)
+        if remaining is None:
+            return
+        try:
+            fn_timeout = remaining() / 1000.0
+        except Exception:
+            return
+        self.recommended_visibility_timeout = 6 * fn_timeout
+        if visibility_timeout < self.recommended_visibility_timeout and not self._undersized_timeout_logged:
+            self._undersized_timeout_logged = True
+            self._log("warning", f"Visibility timeout below 6x function timeout",
+                     visibility_timeout=visibility_timeout,
+                     function_timeout=fn_timeout,
+                     recommended=self.recommended_visibility_timeout)
     
     def _default_warning_callback(self, payload: dict, record: dict, elapsed: float, timeout: float) -> None:
         msg_id = record.get("messageId", "UNKNOWN")
@@ -55,10 +80,12 @@ class VisibilityTimeoutMonitor(Middleware):
         return self.default_visibility_timeout
     
     async def before(self, payload: dict, record: dict, context: Any, ctx: dict) -> None:
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
         visibility_timeout = self._extract_visibility_timeout(record)
         warning_time = visibility_timeout * self.warning_threshold
-        
+
+        self._check_recommended_timeout(context, visibility_timeout)
+
         self._log("info", f"Starting visibility monitoring", 
                  msg_id=msg_id, timeout=visibility_timeout, warning_at=warning_time)
         
@@ -72,7 +99,7 @@ class VisibilityTimeoutMonitor(Middleware):
         )
     
     async def after(self, payload: dict, record: dict, context: Any, ctx: dict, error: Optional[Exception]) -> None:
-        msg_id = record.get("messageId", "UNKNOWN")
+        msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
         monitor_task = ctx.get("visibility_monitor_task")
         
         if monitor_task and not monitor_task.done():
@@ -166,27 +193,28 @@ class ProcessingTimeMiddleware(Middleware):
             }
     
     async def after(self, payload: dict, record: dict, context: Any, ctx: dict, error: Optional[Exception]) -> None:
-        end_time = time.time()
         end_time_ns = time.perf_counter_ns()
-        
-        start_time = ctx.get("processing_start_time", end_time)
         start_time_ns = ctx.get("processing_start_time_ns", end_time_ns)
-        
-        duration_seconds = end_time - start_time
-        duration_ms = (end_time_ns - start_time_ns) / 1_000_000
-        
+        start_time = ctx.get("processing_start_time", 0.0)
+
+        # Single monotonic integer delta; derive float durations once
+        duration_ns = end_time_ns - start_time_ns
+        duration_seconds = duration_ns / 1_000_000_000
+        duration_ms = duration_ns / 1_000_000
+
+        ctx["processing_duration_ns"] = duration_ns
         ctx["processing_duration_seconds"] = duration_seconds
         ctx["processing_duration_ms"] = duration_ms
         
         if duration_seconds > self.slow_processing_threshold:
-            msg_id = record.get("messageId", "UNKNOWN")
+            msg_id = ctx.get("messageId") or record.get("messageId", "UNKNOWN")
             self._log("warning", f"Slow processing detected", 
                      msg_id=msg_id, duration=duration_seconds)
         
         if self.store_detailed_metrics:
             metrics = ctx.get("processing_metrics", {})
             metrics.update({
-                "end_timestamp": end_time,
+                "end_timestamp": start_time + duration_seconds,
                 "duration_seconds": duration_seconds,
                 "duration_ms": duration_ms,
                 "success": error is None,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional, List, TYPE_CHECKING
+from typing import Callable, Optional, List, TYPE_CHECKING
 from pydantic import BaseModel
 
 from ..types import Handler
@@ -20,12 +20,15 @@ class RouteEntry:
         model: Optional Pydantic model for validation
         middlewares: List of middlewares to apply
         subrouter: Optional nested router
+        schema_parser: Optional compiled parser building a lightweight
+            typed payload (NamedTuple/dataclass) instead of validating
     """
 
     handler: Optional[Handler] = None
     model: Optional[type[BaseModel]] = None
     middlewares: List[Middleware] = field(default_factory=list)
     subrouter: Optional["SQSRouter"] = None
+    schema_parser: Optional[Callable[[dict], object]] = None
 
     @property
     def is_nested(self) -> bool:
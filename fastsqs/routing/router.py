@@ -1,14 +1,74 @@
 from __future__ import annotations
 
+import dataclasses
 import inspect
+import sys
 from typing import Any, Callable, Dict, Iterable, List, Optional, Type, Union
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
+from ..events import SQSEvent
+from ..exceptions import InvalidMessage
 from ..types import Handler, RouteValue
 from ..middleware import Middleware, run_middlewares
 from ..utils import invoke_handler
 from .entry import RouteEntry
 
+_TYPE_ADAPTERS: Dict[type, TypeAdapter] = {}
+
+
+def _validate_payload(model: Type[BaseModel], payload: dict) -> BaseModel:
+    """Validate a payload against a model via a cached TypeAdapter.
+
+    The adapter's compiled validator is built once per model class
+    (usually at route registration) and reused for every record.
+    """
+    adapter = _TYPE_ADAPTERS.get(model)
+    if adapter is None:
+        adapter = _TYPE_ADAPTERS[model] = TypeAdapter(model)
+    return adapter.validate_python(payload)
+
+
+_HANDLER_INFO: Dict[Any, tuple] = {}
+
+
+def _handler_info(handler: Handler) -> tuple:
+    """Inspect a handler's signature once and cache the result.
+
+    Returns:
+        Tuple of (model class annotated on the first parameter or None,
+        whether the second parameter is the ctx dict)
+    """
+    info = _HANDLER_INFO.get(handler)
+    if info is None:
+        params = list(inspect.signature(handler).parameters.values())
+        model_class = None
+        if params and hasattr(params[0].annotation, "model_validate"):
+            model_class = params[0].annotation
+        ctx_is_second = len(params) >= 2 and "ctx" in params[1].name
+        info = _HANDLER_INFO[handler] = (model_class, ctx_is_second)
+    return info
+
+
+def _compile_schema_parser(schema: type) -> Callable[[dict], object]:
+    """Compile a payload parser for a NamedTuple or __slots__ dataclass.
+
+    The field list is resolved once here; per record the parser does one
+    dict.get per field and builds the typed object, whose attribute
+    access is a C-level slot read instead of a dict probe.
+    """
+    field_names = getattr(schema, "_fields", None)
+    if field_names is None and dataclasses.is_dataclass(schema):
+        field_names = tuple(f.name for f in dataclasses.fields(schema))
+    if field_names is None:
+        raise ValueError(
+            f"schema must be a NamedTuple or dataclass, got {schema}"
+        )
+
+    def parse(payload: dict) -> object:
+        return schema(**{name: payload.get(name) for name in field_names})
+
+    return parse
+
 
 class SQSRouter:
     """Router for handling SQS messages with multiple routing strategies.
@@ -60,24 +120,36 @@ class SQSRouter:
 
         self._pydantic_routes: Dict[str, tuple[Type[BaseModel], Handler]] = {}
         self._route_lookup: Dict[str, str] = {}
+        self._resolved_routes: Dict[str, tuple[Type[BaseModel], Handler]] = {}
+        # One-slot cache for homogeneous batches: discriminators are
+        # interned, so a pointer compare short-circuits the dict probe
+        # when consecutive records share a message type
+        self._last_message_type: Optional[str] = None
+        self._last_route: Optional[tuple] = None
+        self._flat_routes: Optional[Dict[tuple, tuple]] = None
+        self._flat_key_paths: Dict[str, tuple] = {}
 
     def route(
         self,
         value: Union[RouteValue, Iterable[RouteValue], Type[BaseModel], None] = None,
         *,
         model: Optional[type[BaseModel]] = None,
+        schema: Optional[type] = None,
         middlewares: Optional[List[Middleware]] = None,
     ) -> Callable[[Handler], Handler]:
         """Register a route handler.
-        
+
         Args:
             value: Route value(s) or Pydantic model class
             model: Optional Pydantic model for validation
+            schema: Optional NamedTuple or dataclass for key-value routes;
+                the payload is packed into it without pydantic validation,
+                giving handlers slot-based attribute access on hot paths
             middlewares: Optional list of middlewares
-            
+
         Returns:
             Decorator function for the handler
-            
+
         Raises:
             ValueError: If event model is invalid or duplicate handler exists
         """
@@ -87,8 +159,6 @@ class SQSRouter:
             and isinstance(value, type)
             and issubclass(value, BaseModel)
         ):
-            from ..events import SQSEvent
-
             if not issubclass(value, SQSEvent):
                 raise ValueError(
                     f"event_model must be a subclass of SQSEvent, got {value}"
@@ -104,7 +174,12 @@ class SQSRouter:
                         f"{self.base_event_class.__name__}"
                     )
 
-            primary_type = value.get_message_type()
+            # Intern route keys so hot-path dict lookups compare by pointer
+            primary_type = sys.intern(value.get_message_type())
+
+            # Build the compiled validator at registration time so the
+            # first record doesn't pay for it
+            _TYPE_ADAPTERS.setdefault(value, TypeAdapter(value))
 
             def decorator(handler: Handler) -> Handler:
                 if primary_type in self._pydantic_routes:
@@ -117,6 +192,7 @@ class SQSRouter:
                 if self.flexible_matching:
                     variants = value.get_message_type_variants()
                     for variant in variants:
+                        variant = sys.intern(variant)
                         if variant not in self._route_lookup:
                             self._route_lookup[variant] = primary_type
 
@@ -143,6 +219,18 @@ class SQSRouter:
 
                     self._pydantic_routes[primary_type] = (value, middleware_wrapper)
 
+                # Seed the resolution cache eagerly so even the first
+                # record of each variant is a single dict lookup in
+                # _find_pydantic_route, with no miss-path indirection
+                route = self._pydantic_routes[primary_type]
+                self._resolved_routes[primary_type] = route
+                if self.flexible_matching:
+                    for variant in value.get_message_type_variants():
+                        if self._route_lookup.get(variant) == primary_type:
+                            self._resolved_routes.setdefault(sys.intern(variant), route)
+                self._last_message_type = None
+                self._last_route = None
+
                 return handler
 
             return decorator
@@ -158,10 +246,11 @@ class SQSRouter:
 
         # Handle string/int value routing
         values = [value] if isinstance(value, (str, int)) else list(value)
+        schema_parser = _compile_schema_parser(schema) if schema is not None else None
 
         def decorator(fn: Handler) -> Handler:
             for v in values:
-                k = str(v)
+                k = sys.intern(str(v))
                 if k in self._routes:
                     existing = self._routes[k]
                     if existing.handler is not None:
@@ -169,33 +258,96 @@ class SQSRouter:
                     existing.handler = fn
                     existing.model = model
                     existing.middlewares = list(middlewares or [])
+                    existing.schema_parser = schema_parser
                 else:
                     self._routes[k] = RouteEntry(
-                        handler=fn, model=model, middlewares=list(middlewares or [])
+                        handler=fn,
+                        model=model,
+                        middlewares=list(middlewares or []),
+                        schema_parser=schema_parser,
                     )
+            self._flat_routes = None
             return fn
 
         return decorator
 
+    def _build_flat_dispatch(self) -> None:
+        """Flatten the subrouter tree into a tuple-key dispatch table.
+
+        Walks every nested branch and records, per leaf handler, the
+        discriminator value path (e.g. ("create", "user")), its key path
+        (("action", "entity")), the router that owns the leaf, and the
+        middleware list accumulated along the walk. Dispatch then resolves
+        a nested message with one tuple lookup instead of recursing
+        through routers. Branches whose first value maps to handlers at
+        several depths are left to the recursive path.
+        """
+        flat: Dict[tuple, tuple] = {}
+        key_paths: Dict[str, tuple] = {}
+        ambiguous: set = set()
+
+        def walk(router: "SQSRouter", values: tuple, keys: tuple, parent_mws: List[Middleware]) -> None:
+            for value, entry in router._routes.items():
+                if value == "*":
+                    continue
+                branch_values = values + (value,)
+                branch_keys = keys + (router.key,)
+                first = branch_values[0]
+                if entry.handler is not None and entry.subrouter is not None:
+                    ambiguous.add(first)
+                    continue
+                if entry.handler is not None:
+                    flat[branch_values] = (router, entry, parent_mws)
+                    existing = key_paths.get(first)
+                    if existing is not None and existing != branch_keys:
+                        ambiguous.add(first)
+                    else:
+                        key_paths[first] = branch_keys
+                elif entry.subrouter is not None:
+                    if router.inherit_middlewares:
+                        combined = parent_mws + router._middlewares + entry.middlewares
+                    else:
+                        combined = list(entry.middlewares)
+                    walk(entry.subrouter, branch_values, branch_keys, combined)
+
+        walk(self, (), (), [])
+        for first in ambiguous:
+            key_paths.pop(first, None)
+        self._flat_routes = flat
+        self._flat_key_paths = key_paths
+
     def _find_pydantic_route(
         self, message_type: str
     ) -> Optional[tuple[Type[BaseModel], Handler]]:
         """Find a pydantic route by message type.
-        
+
+        Resolutions are cached, so the variant indirection through
+        _route_lookup is paid once per message type and subsequent
+        messages hit a single dict lookup.
+
         Args:
             message_type: Message type to search for
-            
+
         Returns:
             Tuple of (model_class, handler) if found, None otherwise
         """
-        if message_type in self._pydantic_routes:
-            return self._pydantic_routes[message_type]
-
-        if self.flexible_matching and message_type in self._route_lookup:
-            primary_type = self._route_lookup[message_type]
-            return self._pydantic_routes[primary_type]
-
-        return None
+        if message_type is self._last_message_type:
+            return self._last_route
+
+        route = self._resolved_routes.get(message_type)
+        if route is None:
+            route = self._pydantic_routes.get(message_type)
+            if route is None and self.flexible_matching:
+                primary_type = self._route_lookup.get(message_type)
+                if primary_type is not None:
+                    route = self._pydantic_routes.get(primary_type)
+            if route is not None:
+                self._resolved_routes[message_type] = route
+
+        if route is not None:
+            self._last_message_type = message_type
+            self._last_route = route
+        return route
 
     def wildcard(
         self,
@@ -217,6 +369,7 @@ class SQSRouter:
                 self._routes["*"] = RouteEntry(
                     handler=fn, model=model, middlewares=list(middlewares or [])
                 )
+            self._flat_routes = None
             return fn
 
         return decorator
@@ -239,11 +392,12 @@ class SQSRouter:
 
         if router is not None:
             for v in values:
-                k = str(v)
+                k = sys.intern(str(v))
                 if k in self._routes:
                     self._routes[k].subrouter = router
                 else:
                     self._routes[k] = RouteEntry(subrouter=router)
+            self._flat_routes = None
             return router
 
         def decorator(
@@ -255,11 +409,12 @@ class SQSRouter:
                 router_instance = router_or_fn
 
             for v in values:
-                k = str(v)
+                k = sys.intern(str(v))
                 if k in self._routes:
                     self._routes[k].subrouter = router_instance
                 else:
                     self._routes[k] = RouteEntry(subrouter=router_instance)
+            self._flat_routes = None
             return router_instance
 
         return decorator
@@ -305,14 +460,14 @@ class SQSRouter:
 
         # First try pydantic-based routing (using message_type_key)
         message_type = payload.get(self.message_type_key)
+        if isinstance(message_type, str):
+            message_type = sys.intern(message_type)
         if message_type:
             pydantic_route = self._find_pydantic_route(message_type)
             if pydantic_route:
                 event_model, handler = pydantic_route
                 try:
-                    from ..exceptions import InvalidMessage
-
-                    event_instance = event_model.model_validate(payload)
+                    event_instance = _validate_payload(event_model, payload)
                     ctx["message_type"] = message_type
                     result = await invoke_handler(
                         handler,
@@ -335,6 +490,46 @@ class SQSRouter:
             return False
 
         str_value = str(key_value)
+        # Discriminator values form a small closed set, so interning them
+        # lets the dict probes hit the pointer-compare fast path; the
+        # length guard keeps junk values out of the intern table
+        if len(str_value) <= 64:
+            str_value = sys.intern(str_value)
+
+        # Tuple-key fast path: resolve the whole nested chain with one
+        # lookup when this branch was flattened. Stored middleware lists
+        # assume this router is the dispatch root, so skip when called
+        # with inherited parents.
+        if not parent_middlewares:
+            if self._flat_routes is None:
+                self._build_flat_dispatch()
+            key_path = self._flat_key_paths.get(str_value)
+            if key_path is not None:
+                try:
+                    values = tuple(str(payload[k]) for k in key_path)
+                except KeyError:
+                    values = None
+                if values is not None:
+                    target = self._flat_routes.get(values)
+                    if target is not None:
+                        leaf_router, entry, leaf_parent_mws = target
+                        route_path = ctx.setdefault("route_path", [])
+                        route_path.extend(
+                            f"{k}={v}" for k, v in zip(key_path, values)
+                        )
+                        await leaf_router._execute_handler(
+                            entry.handler,
+                            entry.model,
+                            entry.middlewares,
+                            payload,
+                            record,
+                            context,
+                            ctx,
+                            root_payload,
+                            leaf_parent_mws,
+                            entry.schema_parser,
+                        )
+                        return True
 
         route_path = ctx.setdefault("route_path", [])
         route_path.append(f"{self.key}={str_value}")
@@ -388,6 +583,7 @@ class SQSRouter:
                 ctx,
                 root_payload,
                 parent_middlewares,
+                entry.schema_parser,
             )
             return True
 
@@ -405,9 +601,10 @@ class SQSRouter:
         ctx: dict,
         root_payload: dict,
         parent_middlewares: List[Middleware],
+        schema_parser: Optional[Callable[[dict], object]] = None,
     ) -> None:
         """Execute a handler with middleware chain.
-        
+
         Args:
             handler: Handler function to execute
             model: Optional Pydantic model for validation
@@ -418,7 +615,8 @@ class SQSRouter:
             ctx: Processing context
             root_payload: Original root payload
             parent_middlewares: Parent router middlewares
-            
+            schema_parser: Optional compiled parser for typed payloads
+
         Raises:
             ValidationError: If model validation fails
         """
@@ -434,33 +632,30 @@ class SQSRouter:
         err: Optional[Exception] = None
         await run_middlewares(all_mws, "before", handler_payload, record, context, ctx)
 
+        # Signature facts are cached per handler, so the inspect walk
+        # runs once per function instead of per record
+        annotated_model, ctx_is_second = _handler_info(handler)
+
         try:
-            if model is not None:
+            if schema_parser is not None:
+                msg = schema_parser(payload)
+            elif model is not None:
                 try:
-                    msg = model.model_validate(payload)
+                    msg = _validate_payload(model, payload)
                 except ValidationError as e:
                     raise ValidationError(f"Validation failed for {self.key}: {e}")
             else:
-                sig = inspect.signature(handler)
-                params = list(sig.parameters.values())
-
-                if params and hasattr(params[0].annotation, "model_validate"):
-                    model_class = params[0].annotation
+                if annotated_model is not None:
                     try:
-                        msg = model_class.model_validate(payload)
+                        msg = _validate_payload(annotated_model, payload)
                     except ValidationError as e:
                         raise ValidationError(
-                            f"Validation failed for {model_class.__name__}: {e}"
+                            f"Validation failed for {annotated_model.__name__}: {e}"
                         )
                 else:
-                    from ..events import SQSEvent
-
-                    msg = SQSEvent.model_validate(payload)
-
-            sig = inspect.signature(handler)
-            params = list(sig.parameters.keys())
+                    msg = _validate_payload(SQSEvent, payload)
 
-            if len(params) >= 2 and "ctx" in params[1]:
+            if ctx_is_second:
                 result = await invoke_handler(
                     handler,
                     msg=msg,
@@ -3,11 +3,56 @@
 from __future__ import annotations
 
 import inspect
-from typing import Any, Awaitable, Callable, Dict, List
+import json
+from typing import Any, Awaitable, Callable, Collection, Dict, List, Union
 
 from .types import Handler
 from .telemetry import trace_function, SpanKind
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document using orjson when available.
+
+    Falls back to the stdlib json module when orjson is not installed.
+
+    Args:
+        data: JSON document as str, bytes, or memoryview
+
+    Returns:
+        Deserialized Python object
+    """
+    if _orjson is not None:
+        # orjson reads str, bytes and memoryview directly (no copy)
+        return _orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode()
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, *, sort_keys: bool = False) -> str:
+    """Serialize an object to a compact JSON string using orjson when available.
+
+    Falls back to the stdlib json module when orjson is not installed.
+
+    Args:
+        obj: Object to serialize
+        sort_keys: Whether to sort dictionary keys
+
+    Returns:
+        JSON string
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_SORT_KEYS if sort_keys else 0
+        return _orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"))
+
 
 def group_records_by_message_group(
     records: List[dict]
@@ -33,24 +78,36 @@ def group_records_by_message_group(
     return groups
 
 
+# Accepted keyword names per handler; signatures never change at runtime
+# so the inspect.signature walk is paid once per function, not per record.
+# None marks callables whose signature cannot be introspected.
+_ACCEPTED_KWARGS_CACHE: Dict[Any, Any] = {}
+
+
 def select_kwargs(fn: Handler, **candidates) -> Dict[str, Any]:
     """Select keyword arguments that match function signature.
-    
+
     Args:
         fn: Handler function to inspect
         **candidates: Candidate keyword arguments
-        
+
     Returns:
         Dictionary of matching keyword arguments
     """
     try:
-        sig = inspect.signature(fn)
-    except (ValueError, TypeError):
+        accepted = _ACCEPTED_KWARGS_CACHE[fn]
+    except KeyError:
+        try:
+            sig = inspect.signature(fn)
+            accepted = frozenset(
+                p.name for p in sig.parameters.values()
+                if p.kind in (p.KEYWORD_ONLY, p.POSITIONAL_OR_KEYWORD)
+            )
+        except (ValueError, TypeError):
+            accepted = None
+        _ACCEPTED_KWARGS_CACHE[fn] = accepted
+    if accepted is None:
         return candidates
-    accepted = {
-        p.name for p in sig.parameters.values()
-        if p.kind in (p.KEYWORD_ONLY, p.POSITIONAL_OR_KEYWORD)
-    }
     return {k: v for k, v in candidates.items() if k in accepted}
 
 
@@ -71,21 +128,22 @@ async def invoke_handler(fn: Handler, **kwargs) -> Any:
     return result
 
 
-def shallow_mask(d: dict, fields: List[str], mask: str = "***") -> dict:
+def shallow_mask(d: dict, fields: Collection[str], mask: str = "***") -> dict:
     """Mask sensitive fields in a dictionary.
-    
+
     Args:
         d: Dictionary to mask
-        fields: List of field names to mask
+        fields: Field names to mask; pass a frozenset for repeated calls
         mask: Mask string to use
-        
+
     Returns:
         New dictionary with masked fields
     """
     if not fields:
         return d
+    to_mask = d.keys() & fields if isinstance(fields, (set, frozenset)) else fields
     out = dict(d)
-    for f in fields:
+    for f in to_mask:
         if f in out:
             out[f] = mask
     return out
\ No newline at end of file